@@ -0,0 +1,169 @@
+"""
+KINETIC-OS Camera Module
+=========================
+Threaded webcam capture.
+Keeps frame grabbing off the main loop so it overlaps with gesture
+handling and rendering.
+"""
+
+import queue
+import threading
+import cv2
+import numpy as np
+from typing import Optional
+
+
+class CameraStream:
+    """
+    Webcam reader that captures and mirrors frames on a background thread.
+
+    The newest frame waits in a one-slot queue; if the main loop falls
+    behind, the waiting frame is replaced rather than queued, so read()
+    always returns the freshest capture. Frames are decoded into a small
+    pool of reused buffers, so steady-state capture allocates nothing.
+    If capturing raises, the thread stops and read() re-raises the error.
+    """
+
+    # Frame buffers in the pool: one being captured into, one waiting in
+    # the slot and one held by the caller until its next read()
+    _POOL_SIZE = 3
+
+    def __init__(self, index: int, width: int, height: int, fps: int,
+                 use_opencl: bool = False):
+        """
+        Open the camera and start the capture thread.
+
+        Args:
+            index: Camera device index.
+            width: Requested capture width in pixels.
+            height: Requested capture height in pixels.
+            fps: Requested capture frame rate.
+            use_opencl: Mirror frames on an OpenCL device, if one is
+                available.
+
+        Raises:
+            RuntimeError: If the camera cannot be opened.
+        """
+        self.cap = cv2.VideoCapture(index)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Failed to open camera at index {index}")
+
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+        # Keep at most one frame queued in the driver so a stall in this
+        # process never leaves stale frames waiting (ignored by backends
+        # without the property)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # Actual frame dimensions (the driver may not honour the request)
+        self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+        # Holds a mirrored BGR frame, or None for a failed capture
+        self._frames: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(
+            maxsize=1)
+        self._stopped = threading.Event()
+        # Exception that stopped the capture thread, re-raised by read()
+        self._error: Optional[Exception] = None
+
+        # OpenCL path: frames are mirrored as UMats on the device. Each
+        # download is a new array, so the buffer pool is bypassed there.
+        self._use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+
+        self._free_frames: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(self._POOL_SIZE):
+            self._free_frames.put(np.empty(
+                (self.frame_height, self.frame_width, 3), dtype=np.uint8))
+        # Frame returned by the last read(), recycled on the next one
+        self._held: Optional[np.ndarray] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="CameraStream", daemon=True)
+        self._thread.start()
+
+    def read(self) -> Optional[np.ndarray]:
+        """
+        Wait for the next captured frame.
+
+        Each frame is returned at most once and belongs to the caller
+        until the next read(), so it can be drawn on in place; its buffer
+        is then reused for a later capture.
+
+        Returns:
+            Mirrored BGR frame, or None if the capture failed.
+
+        Raises:
+            Exception: Whatever stopped the capture thread, if it failed.
+        """
+        self._raise_capture_error()
+        if self._held is not None:
+            self._recycle(self._held)
+        self._held = self._frames.get()
+        # A failing capture thread publishes None to wake this call
+        self._raise_capture_error()
+        return self._held
+
+    def _raise_capture_error(self) -> None:
+        """Re-raise the exception that stopped the capture thread, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def _recycle(self, frame: np.ndarray) -> None:
+        """Return a frame's buffer to the pool once it is no longer used."""
+        if not self._use_opencl:
+            self._free_frames.put(frame)
+
+    def _capture(self) -> Optional[np.ndarray]:
+        """Grab one frame and mirror it; None if the capture failed."""
+        if self._use_opencl:
+            ret, frame = self.cap.read()
+            if not ret:
+                return None
+            # Upload, flip for mirror effect on the device and download
+            return cv2.flip(cv2.UMat(frame), 1).get()
+
+        # Decode into a pooled buffer (OpenCV only allocates a new array
+        # if the driver delivers a different frame size)
+        buffer = self._free_frames.get()
+        ret, frame = self.cap.read(buffer)
+        if not ret:
+            self._free_frames.put(buffer)
+            return None
+
+        # Flip frame for mirror effect, in place
+        cv2.flip(frame, 1, dst=frame)
+        return frame
+
+    def _publish(self, frame: Optional[np.ndarray]) -> None:
+        """Put frame in the slot, replacing any frame still waiting."""
+        # Drop a frame the main loop has not picked up yet, returning its
+        # buffer to the pool. Only this thread fills the slot, so it is
+        # guaranteed empty afterwards.
+        try:
+            stale = self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if stale is not None:
+                self._recycle(stale)
+        self._frames.put_nowait(frame)
+
+    def _run(self) -> None:
+        """Capture loop: grab, mirror and publish frames until stopped."""
+        try:
+            while not self._stopped.is_set():
+                self._publish(self._capture())
+        except Exception as e:
+            # Hand the error to the main loop instead of leaving read()
+            # blocked on a dead thread
+            self._error = e
+            self._publish(None)
+
+    def release(self) -> None:
+        """Stop the capture thread and release the camera."""
+        self._stopped.set()
+        self._thread.join()
+        self.cap.release()
@@ -12,14 +12,38 @@ CAMERA_INDEX = 0  # Default webcam index (0 for built-in, 1+ for external)
 CAMERA_WIDTH = 640  # Camera capture width
 CAMERA_HEIGHT = 480  # Camera capture height
 CAMERA_FPS = 30  # Target frames per second
+# Mirror captured frames on the GPU through OpenCL (cv2.UMat). Only helps
+# with large frames on systems with a fast OpenCL device; ignored if no
+# device is available. Without one the upload/download costs ~10x a CPU
+# flip, so this is off by default.
+USE_OPENCL = False
 
 # =============================================================================
 # HAND DETECTION SETTINGS
 # =============================================================================
 MIN_DETECTION_CONFIDENCE = 0.7  # Minimum confidence for initial detection
-MIN_TRACKING_CONFIDENCE = 0.7  # Minimum confidence for landmark tracking
+# Minimum confidence for landmark tracking. Kept below the detection
+# confidence so brief dips stay on MediaPipe's cheap tracking path instead
+# of re-running full palm detection.
+MIN_TRACKING_CONFIDENCE = 0.5
 MAX_NUM_HANDS = 1  # Only track one hand for optimal performance
 
+# Rebuild the MediaPipe graph once after this many consecutive frames
+# without a hand, to clear any stale tracking state
+HAND_LOST_RESET_FRAMES = 30
+
+# =============================================================================
+# MOTION GATE SETTINGS
+# =============================================================================
+# While no hand is tracked, frames whose 8x8 thumbnail cells all differ
+# from the last inferred frame by less than this intensity (0-255) skip
+# MediaPipe. Each cell averages hundreds of pixels, so sensor noise stays
+# well below this.
+MOTION_SKIP_THRESHOLD = 1.0
+
+# Maximum consecutive frames that may reuse a detection (~0.5 s at 30 FPS)
+MOTION_MAX_SKIP_FRAMES = 15
+
 # =============================================================================
 # CURSOR SMOOTHING SETTINGS (CRITICAL)
 # =============================================================================
@@ -28,6 +52,17 @@ MAX_NUM_HANDS = 1  # Only track one hand for optimal performance
 # Recommended range: 4 to 10
 SMOOTHING_FACTOR = 6
 
+# EMA weight derived from SMOOTHING_FACTOR (multiplied instead of dividing
+# by the factor every frame). Note: the classical N-period EMA uses
+# alpha = 2 / (N + 1); here alpha = 1 / N, so a factor of 6 behaves like
+# an 11-period classical EMA.
+SMOOTHING_ALPHA = 1.0 / SMOOTHING_FACTOR
+
+# Skip cursor moves smaller than this many screen pixels (|dx| + |dy|).
+# The EMA keeps producing tiny steps while the hand hovers; each move is a
+# round of X traffic. 1 only skips moves to the same pixel.
+CURSOR_MIN_DELTA = 2
+
 # =============================================================================
 # ACTIVE REGION SETTINGS
 # =============================================================================
@@ -38,6 +73,14 @@ ACTIVE_REGION_X_END = 0.8    # 80% from left edge (60% active width)
 ACTIVE_REGION_Y_START = 0.2  # 20% from top edge
 ACTIVE_REGION_Y_END = 0.8    # 80% from top edge (60% active height)
 
+# Send only the active region (widened by INFERENCE_ROI_MARGIN of the frame
+# on each side) to MediaPipe instead of the whole frame; inference cost
+# scales with input area. The margin keeps the rest of the hand in view
+# while the index fingertip is near the region's edge. Landmarks are mapped
+# back to full-frame coordinates. Set to False to run on the full frame.
+INFERENCE_ROI_CROP = True
+INFERENCE_ROI_MARGIN = 0.15
+
 # =============================================================================
 # GESTURE THRESHOLDS
 # =============================================================================
@@ -82,6 +125,10 @@ HUD_ACTIVE_NODE_RADIUS = 12
 HUD_FONT_SCALE = 0.6    # Font size for HUD text
 HUD_STATUS_BAR_HEIGHT = 40  # Height of status bar
 
+# Maximum HUD redraw rate. Gestures are still processed on every frame;
+# only the preview is drawn less often. 0 = redraw every frame.
+HUD_MAX_FPS = 30
+
 # =============================================================================
 # CLICK DEBOUNCE SETTINGS
 # =============================================================================
@@ -7,8 +7,67 @@ and coordinate mapping with active region support.
 """
 
 import math
-from typing import Tuple, Optional, List
+from collections import deque
+from typing import Tuple, Optional, Deque
 import config
+from gesture_kernel import is_touching
+from jit import njit, plain_njit
+
+# True when this module was compiled with Cython (see README). It is then
+# already native code, and Numba cannot JIT-compile compiled functions.
+# Inside a compiled module "import cython" is resolved at build time, so
+# the ImportError branch only runs for plain Python without Cython.
+try:
+    import cython
+    _AOT_COMPILED = cython.compiled
+except ImportError:
+    _AOT_COMPILED = False
+
+if _AOT_COMPILED:
+    njit = plain_njit
+
+# Squared click threshold, so click checks can skip the sqrt
+CLICK_THRESHOLD_SQ = config.CLICK_THRESHOLD ** 2
+
+
+def _build_cursor_kernel(alpha: float, axs: float, axe: float,
+                         ays: float, aye: float, scale_x: float,
+                         scale_y: float, sw: int, sh: int,
+                         fx: int, fy: int):
+    """
+    Build a fused EMA smoothing + mapping + fail-safe kernel.
+
+    The EMA weight, region bounds, screen size and fail-safe bounds are
+    fixed for a session, so they are captured as closure constants rather
+    than passed per call; Numba folds them into the compiled code as
+    immediates.
+
+    Returns:
+        Function (prev_x, prev_y, raw_x, raw_y) ->
+        (screen_x, screen_y, in_failsafe, smoothed_x, smoothed_y) with the
+        same arithmetic as smooth_position, map_to_screen and
+        is_in_failsafe_region.
+    """
+    @njit(fastmath=True)
+    def kernel(prev_x: float, prev_y: float, raw_x: float,
+               raw_y: float) -> Tuple[int, int, bool, float, float]:
+        sx = prev_x + (raw_x - prev_x) * alpha
+        sy = prev_y + (raw_y - prev_y) * alpha
+
+        # Ternary clamps compile to branch-free min/max
+        cx = axs if sx < axs else (axe if sx > axe else sx)
+        cy = ays if sy < ays else (aye if sy > aye else sy)
+
+        # X is mirrored: the region's left edge maps to the screen's right.
+        # Under Numba int() is a single native float-to-int conversion.
+        px = int(sw - (cx - axs) * scale_x)
+        py = int((cy - ays) * scale_y)
+        px = 0 if px < 0 else (sw - 1 if px > sw - 1 else px)
+        py = 0 if py < 0 else (sh - 1 if py > sh - 1 else py)
+
+        return px, py, px < fx and py < fy, sx, sy
+
+    return kernel
 
 
 class CursorMath:
@@ -32,12 +91,16 @@ class CursorMath:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        # Previous smoothed position for EMA filter
-        self._prev_x: Optional[float] = None
-        self._prev_y: Optional[float] = None
+        # Previous smoothed position for EMA filter. Plain floats plus a
+        # flag (rather than Optional values) keep the state typed for AOT
+        # compilers such as Cython or mypyc.
+        self._has_prev = False
+        self._prev_x = 0.0
+        self._prev_y = 0.0
 
         # Previous raw Y position for scroll calculation
-        self._prev_scroll_y: Optional[float] = None
+        self._has_scroll_ref = False
+        self._prev_scroll_y = 0.0
 
         # Active region boundaries (normalized 0-1)
         self.active_x_start = config.ACTIVE_REGION_X_START
@@ -45,12 +108,41 @@ class CursorMath:
         self.active_y_start = config.ACTIVE_REGION_Y_START
         self.active_y_end = config.ACTIVE_REGION_Y_END
 
+        # Screen pixels per unit of normalized movement inside the active
+        # region, precomputed so mapping is one multiply per axis
+        self._scale_x = screen_width / (
+            self.active_x_end - self.active_x_start)
+        self._scale_y = screen_height / (
+            self.active_y_end - self.active_y_start)
+
+        # Config values read every frame, bound once to skip module lookups
+        self._alpha = config.SMOOTHING_ALPHA
+        self._scroll_gain = config.SCROLL_SENSITIVITY * 100
+        self._failsafe_x_end = config.FAILSAFE_X_END
+        self._failsafe_y_end = config.FAILSAFE_Y_END
+
+        # Cursor kernel specialized for this screen and active region
+        self._cursor_kernel = _build_cursor_kernel(
+            self._alpha,
+            self.active_x_start, self.active_x_end,
+            self.active_y_start, self.active_y_end,
+            self._scale_x, self._scale_y,
+            self.screen_width, self.screen_height,
+            self._failsafe_x_end, self._failsafe_y_end
+        )
+
+        # Warm up the cursor kernel so any JIT compile happens at startup
+        # rather than on the first tracked frame
+        self.process_cursor(0.5, 0.5)
+        self.reset_smoothing()
+
     def smooth_position(self, raw_x: float,
                         raw_y: float) -> Tuple[float, float]:
         """
         Apply Exponential Moving Average (EMA) smoothing to cursor position.
 
-        Formula: current = prev + (raw - prev) / smoothing_factor
+        Formula: current = prev + (raw - prev) * alpha,
+        where alpha = 1 / smoothing_factor (config.SMOOTHING_ALPHA).
 
         Args:
             raw_x: Raw X coordinate (normalized 0-1).
@@ -59,16 +151,17 @@ class CursorMath:
         Returns:
             Tuple of (smoothed_x, smoothed_y) coordinates.
         """
-        if self._prev_x is None or self._prev_y is None:
+        if not self._has_prev:
             # First frame - initialize with raw values
+            self._has_prev = True
             self._prev_x = raw_x
             self._prev_y = raw_y
             return raw_x, raw_y
 
         # Apply EMA smoothing
-        smoothing = config.SMOOTHING_FACTOR
-        smoothed_x = self._prev_x + (raw_x - self._prev_x) / smoothing
-        smoothed_y = self._prev_y + (raw_y - self._prev_y) / smoothing
+        alpha = self._alpha
+        smoothed_x = self._prev_x + (raw_x - self._prev_x) * alpha
+        smoothed_y = self._prev_y + (raw_y - self._prev_y) * alpha
 
         # Update previous values
         self._prev_x = smoothed_x
@@ -90,29 +183,62 @@ class CursorMath:
         Returns:
             Tuple of (screen_x, screen_y) in pixels.
         """
-        # Clamp to active region boundaries
-        clamped_x = max(self.active_x_start, min(self.active_x_end, norm_x))
-        clamped_y = max(self.active_y_start, min(self.active_y_end, norm_y))
+        axs, axe = self.active_x_start, self.active_x_end
+        ays, aye = self.active_y_start, self.active_y_end
+        max_x = self.screen_width - 1
+        max_y = self.screen_height - 1
+
+        # Clamp to active region boundaries (conditional expressions avoid
+        # the min()/max() call overhead)
+        clamped_x = axs if norm_x < axs else axe if norm_x > axe else norm_x
+        clamped_y = ays if norm_y < ays else aye if norm_y > aye else norm_y
+
+        # Map from active region to screen coordinates, flipping the X axis
+        # (mirror mode - more intuitive control). Plain int() on Python
+        # floats is cheaper here than casting through NumPy scalars.
+        screen_x = int(self.screen_width - (clamped_x - axs) * self._scale_x)
+        screen_y = int((clamped_y - ays) * self._scale_y)
 
-        # Map from active region to 0-1 range
-        active_width = self.active_x_end - self.active_x_start
-        active_height = self.active_y_end - self.active_y_start
+        # Ensure within screen bounds
+        screen_x = (0 if screen_x < 0
+                    else max_x if screen_x > max_x else screen_x)
+        screen_y = (0 if screen_y < 0
+                    else max_y if screen_y > max_y else screen_y)
 
-        mapped_x = (clamped_x - self.active_x_start) / active_width
-        mapped_y = (clamped_y - self.active_y_start) / active_height
+        return screen_x, screen_y
 
-        # Flip X axis (mirror mode - more intuitive control)
-        mapped_x = 1.0 - mapped_x
+    def process_cursor(self, raw_x: float,
+                       raw_y: float) -> Tuple[int, int, bool]:
+        """
+        Run the whole per-frame cursor pipeline in one call.
 
-        # Convert to screen coordinates
-        screen_x = int(mapped_x * self.screen_width)
-        screen_y = int(mapped_y * self.screen_height)
+        Smooths the raw position, maps it to screen coordinates and checks
+        the fail-safe region in a single (Numba-compiled when available)
+        kernel. Prefer this over calling smooth_position, map_to_screen
+        and is_in_failsafe_region separately; those remain for callers
+        that need the individual steps.
 
-        # Ensure within screen bounds
-        screen_x = max(0, min(self.screen_width - 1, screen_x))
-        screen_y = max(0, min(self.screen_height - 1, screen_y))
+        Args:
+            raw_x: Raw X coordinate (normalized 0-1).
+            raw_y: Raw Y coordinate (normalized 0-1).
 
-        return screen_x, screen_y
+        Returns:
+            Tuple of (screen_x, screen_y, in_failsafe), with the screen
+            coordinates in pixels.
+        """
+        raw_x = float(raw_x)
+        raw_y = float(raw_y)
+
+        if not self._has_prev:
+            # First frame - seed the filter so it returns the raw values
+            self._has_prev = True
+            self._prev_x = raw_x
+            self._prev_y = raw_y
+
+        (screen_x, screen_y, in_failsafe,
+         self._prev_x, self._prev_y) = self._cursor_kernel(
+            self._prev_x, self._prev_y, raw_x, raw_y)
+        return screen_x, screen_y, in_failsafe
 
     @staticmethod
     def euclidean_distance(
@@ -144,7 +270,8 @@ class CursorMath:
         Determine if a click gesture is being made.
 
         A click is detected when the distance between thumb and finger
-        is less than the configured threshold.
+        is less than the configured threshold (see
+        gesture_kernel.is_touching).
 
         Args:
             thumb_tip: Thumb tip coordinates (x, y, z).
@@ -153,33 +280,35 @@ class CursorMath:
         Returns:
             True if click detected, False otherwise.
         """
-        distance = CursorMath.euclidean_distance(thumb_tip, finger_tip)
-        return distance < config.CLICK_THRESHOLD
+        return bool(is_touching(thumb_tip[0], thumb_tip[1], finger_tip[0],
+                                finger_tip[1], CLICK_THRESHOLD_SQ))
 
-    def calculate_scroll_delta(self, current_y: float) -> int:
+    def try_scroll(self, current_y: float, enabled: bool) -> int:
         """
         Calculate scroll delta from vertical hand movement.
 
+        Only call this while in scroll mode; non-scroll frames need no
+        scroll bookkeeping at all.
+
         Args:
             current_y: Current Y coordinate (normalized 0-1).
+            enabled: True if scrolling was already active on the previous
+                frame. Pass False on the first frame of a scroll gesture:
+                the reference point is reset and no scroll is emitted.
 
         Returns:
             Scroll delta in pixels (positive = scroll down, negative = scroll up).
         """
-        if self._prev_scroll_y is None:
+        if not enabled or not self._has_scroll_ref:
+            self._has_scroll_ref = True
             self._prev_scroll_y = current_y
             return 0
 
-        delta = (current_y - self._prev_scroll_y) * \
-            config.SCROLL_SENSITIVITY * 100
+        delta = (current_y - self._prev_scroll_y) * self._scroll_gain
         self._prev_scroll_y = current_y
 
         return int(delta)
 
-    def reset_scroll_reference(self):
-        """Reset the scroll reference point (call when entering scroll mode)."""
-        self._prev_scroll_y = None
-
     def is_in_failsafe_region(self, screen_x: int, screen_y: int) -> bool:
         """
         Check if the cursor is in the fail-safe exit region.
@@ -191,13 +320,12 @@ class CursorMath:
         Returns:
             True if cursor is in fail-safe region (top-left corner).
         """
-        return (screen_x < config.FAILSAFE_X_END
-                and screen_y < config.FAILSAFE_Y_END)
+        return (screen_x < self._failsafe_x_end
+                and screen_y < self._failsafe_y_end)
 
     def reset_smoothing(self):
         """Reset the smoothing filter (call when hand is lost)."""
-        self._prev_x = None
-        self._prev_y = None
+        self._has_prev = False
 
 
 class FPSCounter:
@@ -210,10 +338,13 @@ class FPSCounter:
         Args:
             sample_size: Number of frames to average over.
         """
-        self._times: List[float] = []
+        self._times: Deque[float] = deque(maxlen=sample_size)
         self._sample_size = sample_size
         self._last_time: Optional[float] = None
 
+        # Running sum of the deltas in _times, so tick() is O(1)
+        self._sum = 0.0
+
     def tick(self, current_time: float) -> float:
         """
         Record a frame and calculate FPS.
@@ -227,14 +358,16 @@ class FPSCounter:
         if self._last_time is not None:
             delta = current_time - self._last_time
             if delta > 0:
+                if len(self._times) == self._sample_size:
+                    # The deque drops its oldest entry on append
+                    self._sum -= self._times[0]
                 self._times.append(delta)
-                if len(self._times) > self._sample_size:
-                    self._times.pop(0)
+                self._sum += delta
 
         self._last_time = current_time
 
         if not self._times:
             return 0.0
 
-        avg_delta = sum(self._times) / len(self._times)
-        return 1.0 / avg_delta if avg_delta > 0 else 0.0
+        # FPS = 1 / average delta = count / sum of deltas
+        return len(self._times) / self._sum if self._sum > 0 else 0.0
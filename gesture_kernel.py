@@ -0,0 +1,127 @@
+"""
+KINETIC-OS Gesture Kernel Module
+=================================
+Per-frame gesture classification compiled with Numba.
+Reads the landmark array once and answers every gesture question the
+main loop asks (fist, left click, right click) in a single call.
+This is the only implementation of the curl and click tests:
+HandEngine.is_finger_curled, HandEngine.is_fist and CursorMath.is_click
+call the kernels below.
+"""
+
+import numpy as np
+from typing import Tuple
+from jit import njit
+
+# MediaPipe landmark indices used by the tests below
+THUMB_TIP = 4
+INDEX_FINGER_TIP = 8
+MIDDLE_FINGER_TIP = 12
+
+# (tip, PIP, MCP) landmark indices of the four fingers checked for a fist
+FIST_JOINTS = np.array([
+    [8, 6, 5],     # index
+    [12, 10, 9],   # middle
+    [16, 14, 13],  # ring
+    [20, 18, 17],  # pinky
+])
+
+
+@njit(cache=True, fastmath=True)
+def is_curled(landmarks: np.ndarray, tip: int, pip: int, mcp: int,
+              curl_ratio_sq: float) -> bool:
+    """
+    Check whether a finger is curled.
+
+    The finger is curled when its tip is closer to the MCP joint than
+    curl_ratio times the PIP joint is, compared on squared 2D distances.
+
+    Args:
+        landmarks: (21, 3) array of normalized landmark coordinates.
+        tip: Landmark index of the fingertip.
+        pip: Landmark index of the finger's PIP joint.
+        mcp: Landmark index of the finger's MCP joint.
+        curl_ratio_sq: Squared tip-to-MCP / PIP-to-MCP ratio below which
+            the finger counts as curled.
+
+    Returns:
+        True if the finger is curled.
+    """
+    mcp_x = landmarks[mcp, 0]
+    mcp_y = landmarks[mcp, 1]
+    tip_dx = landmarks[tip, 0] - mcp_x
+    tip_dy = landmarks[tip, 1] - mcp_y
+    pip_dx = landmarks[pip, 0] - mcp_x
+    pip_dy = landmarks[pip, 1] - mcp_y
+    return (tip_dx * tip_dx + tip_dy * tip_dy
+            < (pip_dx * pip_dx + pip_dy * pip_dy) * curl_ratio_sq)
+
+
+@njit(cache=True, fastmath=True)
+def is_touching(x1: float, y1: float, x2: float, y2: float,
+                click_threshold_sq: float) -> bool:
+    """
+    Check whether two points are within the click distance.
+
+    Args:
+        x1, y1: First point (normalized).
+        x2, y2: Second point (normalized).
+        click_threshold_sq: Squared click distance.
+
+    Returns:
+        True if the 2D distance is below the click threshold.
+    """
+    dx = x1 - x2
+    dy = y1 - y2
+    return dx * dx + dy * dy < click_threshold_sq
+
+
+@njit(cache=True, fastmath=True)
+def is_fist(landmarks: np.ndarray, curl_ratio_sq: float) -> bool:
+    """
+    Check whether the index, middle, ring and pinky fingers are all curled.
+
+    Args:
+        landmarks: (21, 3) array of normalized landmark coordinates.
+        curl_ratio_sq: See is_curled.
+
+    Returns:
+        True if the hand is making a fist.
+    """
+    for i in range(FIST_JOINTS.shape[0]):
+        if not is_curled(landmarks, FIST_JOINTS[i, 0], FIST_JOINTS[i, 1],
+                         FIST_JOINTS[i, 2], curl_ratio_sq):
+            return False
+    return True
+
+
+@njit(cache=True, fastmath=True)
+def classify_hand(landmarks: np.ndarray, click_threshold_sq: float,
+                  curl_ratio_sq: float) -> Tuple[bool, bool, bool]:
+    """
+    Classify the gestures made by a hand.
+
+    Thresholds are passed in rather than read from config so that the
+    on-disk Numba cache never holds stale constants.
+
+    Args:
+        landmarks: (21, 3) array of normalized landmark coordinates.
+        click_threshold_sq: Squared thumb-to-fingertip click distance.
+        curl_ratio_sq: Squared tip-to-MCP / PIP-to-MCP ratio below which
+            a finger counts as curled.
+
+    Returns:
+        Tuple of (is_fist, is_left_click, is_right_click).
+    """
+    thumb_x = landmarks[THUMB_TIP, 0]
+    thumb_y = landmarks[THUMB_TIP, 1]
+
+    # Clicks: thumb tip touching the index or middle fingertip
+    is_left_click = is_touching(
+        thumb_x, thumb_y, landmarks[INDEX_FINGER_TIP, 0],
+        landmarks[INDEX_FINGER_TIP, 1], click_threshold_sq)
+    is_right_click = is_touching(
+        thumb_x, thumb_y, landmarks[MIDDLE_FINGER_TIP, 0],
+        landmarks[MIDDLE_FINGER_TIP, 1], click_threshold_sq)
+
+    return is_fist(landmarks, curl_ratio_sq), is_left_click, is_right_click
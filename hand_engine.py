@@ -5,18 +5,92 @@ MediaPipe-based hand landmark detection engine.
 Optimized for single-hand tracking with high accuracy.
 """
 
+import queue
+import threading
+import cv2
 import mediapipe as mp
 import numpy as np
-from typing import Optional, NamedTuple, List, Tuple
+from typing import Optional, Tuple
 import config
+import gesture_kernel
 
+# A finger is curled when its tip-to-MCP distance is below 1.2x the
+# PIP-to-MCP distance; squared here so the check needs no sqrt. Stored as
+# float32 so curl checks on the float32 landmark array never promote.
+CURL_RATIO_SQ = np.float32(1.2 ** 2)
 
-class HandLandmarks(NamedTuple):
-    """Container for hand landmark data."""
-    landmarks: List[Tuple[float, float, float]
-                    ]  # List of (x, y, z) normalized coords
-    handedness: str  # "Left" or "Right"
-    raw_landmarks: object  # Original MediaPipe landmarks for drawing
+# Normalized (x, y, width, height) of an inference crop within the frame
+RoiBox = Tuple[float, float, float, float]
+
+
+class HandLandmarks:
+    """
+    Container for hand landmark data.
+
+    A plain __slots__ class rather than a NamedTuple: one is created per
+    processed frame, and slots make construction and attribute access
+    cheaper.
+    """
+
+    __slots__ = ("landmarks", "handedness", "raw_landmarks")
+
+    def __init__(self, landmarks: np.ndarray, handedness: str,
+                 raw_landmarks: object):
+        # (21, 3) float32 array of (x, y, z) normalized coords
+        self.landmarks = landmarks
+        self.handedness = handedness  # "Left" or "Right"
+        # Original MediaPipe landmarks (relative to the inference crop)
+        self.raw_landmarks = raw_landmarks
+
+
+class _InferenceCrop:
+    """
+    Part of a camera frame that is sent to MediaPipe.
+
+    The active region widened by INFERENCE_ROI_MARGIN, or the whole frame
+    when INFERENCE_ROI_CROP is off. Recomputed only when the frame size
+    changes.
+    """
+
+    def __init__(self):
+        """Compute the crop for the configured camera size."""
+        self._frame_shape: Optional[Tuple[int, int]] = None
+        self._slices: Tuple[slice, slice] = (slice(None), slice(None))
+        # Normalized (x, y, width, height) of the crop within the frame,
+        # None when the whole frame is used
+        self.roi: Optional[RoiBox] = None
+        self._update(config.CAMERA_HEIGHT, config.CAMERA_WIDTH)
+
+    def _update(self, height: int, width: int) -> None:
+        """Compute the crop for a frame size."""
+        self._frame_shape = (height, width)
+        if not config.INFERENCE_ROI_CROP:
+            self._slices = (slice(None), slice(None))
+            self.roi = None
+            return
+
+        margin = config.INFERENCE_ROI_MARGIN
+        x1 = int(max(config.ACTIVE_REGION_X_START - margin, 0.0) * width)
+        y1 = int(max(config.ACTIVE_REGION_Y_START - margin, 0.0) * height)
+        x2 = int(min(config.ACTIVE_REGION_X_END + margin, 1.0) * width)
+        y2 = int(min(config.ACTIVE_REGION_Y_END + margin, 1.0) * height)
+
+        self._slices = (slice(y1, y2), slice(x1, x2))
+        self.roi = (x1 / width, y1 / height,
+                    (x2 - x1) / width, (y2 - y1) / height)
+
+    def buffer_shape(self) -> Tuple[int, int, int]:
+        """Shape of an RGB buffer holding the current crop."""
+        height, width = self._frame_shape
+        rows, cols = self._slices
+        return (len(range(height)[rows]), len(range(width)[cols]), 3)
+
+    def apply(self, bgr_frame: np.ndarray) -> np.ndarray:
+        """Return a view of the part of a BGR frame sent to MediaPipe."""
+        if bgr_frame.shape[:2] != self._frame_shape:
+            # Camera delivered a different size than configured
+            self._update(*bgr_frame.shape[:2])
+        return bgr_frame[self._slices]
 
 
 class HandEngine:
@@ -52,23 +126,89 @@ class HandEngine:
     PINKY_DIP = 19
     PINKY_TIP = 20
 
+    # Fingertip landmark index per finger name
+    _FINGER_TIPS = {
+        "thumb": THUMB_TIP,
+        "index": INDEX_FINGER_TIP,
+        "middle": MIDDLE_FINGER_TIP,
+        "ring": RING_FINGER_TIP,
+        "pinky": PINKY_TIP
+    }
+
+    # (tip, PIP, MCP) landmark indices per finger name
+    _FINGER_JOINTS = {
+        "index": (INDEX_FINGER_TIP, INDEX_FINGER_PIP, INDEX_FINGER_MCP),
+        "middle": (MIDDLE_FINGER_TIP, MIDDLE_FINGER_PIP, MIDDLE_FINGER_MCP),
+        "ring": (RING_FINGER_TIP, RING_FINGER_PIP, RING_FINGER_MCP),
+        "pinky": (PINKY_TIP, PINKY_PIP, PINKY_MCP)
+    }
+
     def __init__(self):
         """Initialize the MediaPipe Hands solution."""
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.hands = self._create_hands()
+        self._last_result = None
+
+        # Consecutive processed frames without a detected hand
+        self._missed_frames = 0
+
+        # Motion gate: thumbnail of the last frame that went through
+        # MediaPipe, its result, and how many frames in a row reused it
+        self._last_thumb: Optional[np.ndarray] = None
+        self._thumb_shape: Optional[Tuple[int, ...]] = None
+        self._last_landmarks: Optional[HandLandmarks] = None
+        self._skipped_frames = 0
+
+        # Part of each frame converted by process_bgr
+        self._crop = _InferenceCrop()
+
+        # Persistent RGB buffer reused by process_bgr every frame, allocated
+        # by its first call
+        self._rgb_buf: Optional[np.ndarray] = None
+
+    def _create_hands(self):
+        """Create a MediaPipe Hands instance in video (tracking) mode."""
+        return self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=config.MAX_NUM_HANDS,
             min_detection_confidence=config.MIN_DETECTION_CONFIDENCE,
             min_tracking_confidence=config.MIN_TRACKING_CONFIDENCE
         )
-        self._last_result = None
 
-    def process_frame(self, rgb_frame: np.ndarray) -> Optional[HandLandmarks]:
+    def process_bgr(self, bgr_frame: np.ndarray) -> Optional[HandLandmarks]:
+        """
+        Convert a BGR frame to RGB and extract hand landmarks.
+
+        Only the inference crop (see INFERENCE_ROI_CROP) is converted, into
+        a persistent buffer, so no new frame is allocated per call.
+        Landmarks are returned in full-frame coordinates.
+
+        Args:
+            bgr_frame: Input frame in BGR format (as read from OpenCV).
+
+        Returns:
+            HandLandmarks object if a hand is detected, None otherwise.
+        """
+        bgr_crop = self._crop.apply(bgr_frame)
+        if self._rgb_buf is None or self._rgb_buf.shape != bgr_crop.shape:
+            self._rgb_buf = np.empty(bgr_crop.shape, dtype=np.uint8)
+
+        cv2.cvtColor(bgr_crop, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        return self.process_frame(self._rgb_buf, self._crop.roi)
+
+    def process_frame(
+            self,
+            rgb_frame: np.ndarray,
+            roi: Optional[RoiBox] = None
+    ) -> Optional[HandLandmarks]:
         """
         Process an RGB frame and extract hand landmarks.
 
         Args:
             rgb_frame: Input frame in RGB format (not BGR).
+            roi: Normalized (x, y, width, height) of rgb_frame within the
+                full camera frame if it is a crop, so landmarks are mapped
+                back to full-frame coordinates. None for a full frame.
 
         Returns:
             HandLandmarks object if a hand is detected, None otherwise.
@@ -76,26 +216,118 @@ class HandEngine:
         Note:
             This method only processes the frame for landmark detection.
             It does NOT draw on the original frame for optimization.
+            While no hand is tracked, a frame that is visually unchanged
+            from the last one sent to MediaPipe is answered with None
+            without running inference.
+        """
+        if self._is_unchanged(rgb_frame):
+            # Only frames without a hand are gated, so a skipped frame is
+            # still a frame without a hand
+            self._count_miss()
+            return self._last_landmarks
+
+        self._last_landmarks = self._detect(rgb_frame, roi)
+        return self._last_landmarks
+
+    def _is_unchanged(self, rgb_frame: np.ndarray) -> bool:
+        """
+        Check whether a frame can reuse the previous detection result.
+
+        Only gates while no hand is tracked: slow or small finger motion
+        can stay below any thumbnail threshold, so a tracked hand always
+        goes through MediaPipe. Otherwise an 8x8 float grayscale thumbnail
+        is compared against the one from the last inferred frame, using
+        the largest per-cell change. Reuse is capped at
+        MOTION_MAX_SKIP_FRAMES in a row so MediaPipe's state still
+        refreshes regularly.
+
+        Args:
+            rgb_frame: Input frame in RGB format.
+
+        Returns:
+            True if inference can be skipped for this frame.
         """
-        # Process the frame with MediaPipe
-        results = self.hands.process(rgb_frame)
+        if self._last_landmarks is not None:
+            # Hand tracked: no thumbnail needed until it is lost again
+            self._last_thumb = None
+            return False
+
+        # Block means over a 4x decimated view, kept in float so cell
+        # values are not rounded to whole intensity levels
+        small = rgb_frame[::4, ::4]
+        rows = small.shape[0] // 8
+        cols = small.shape[1] // 8
+        thumb = small[:rows * 8, :cols * 8].reshape(
+            8, rows, 8, cols, 3).mean(axis=(1, 3, 4))
+
+        # A thumbnail of a differently shaped frame is not comparable
+        if (self._last_thumb is not None
+                and rgb_frame.shape == self._thumb_shape
+                and self._skipped_frames < config.MOTION_MAX_SKIP_FRAMES
+                and np.abs(thumb - self._last_thumb).max()
+                < config.MOTION_SKIP_THRESHOLD):
+            self._skipped_frames += 1
+            return True
+
+        self._last_thumb = thumb
+        self._thumb_shape = rgb_frame.shape
+        self._skipped_frames = 0
+        return False
+
+    def _count_miss(self) -> None:
+        """Record a frame without a hand, rebuilding the graph if due."""
+        self._missed_frames += 1
+        if self._missed_frames == config.HAND_LOST_RESET_FRAMES:
+            # Hand has been gone for a while: start from a fresh graph
+            # (once per loss) so stale tracking state is dropped
+            self.hands.close()
+            self.hands = self._create_hands()
+
+    def _detect(
+            self,
+            rgb_frame: np.ndarray,
+            roi: Optional[RoiBox] = None
+    ) -> Optional[HandLandmarks]:
+        """Run MediaPipe on a frame and convert the first detected hand."""
+        # Process the frame with MediaPipe. Marking it read-only lets
+        # MediaPipe use the buffer without copying it.
+        was_writeable = rgb_frame.flags.writeable
+        rgb_frame.flags.writeable = False
+        try:
+            results = self.hands.process(rgb_frame)
+        finally:
+            rgb_frame.flags.writeable = was_writeable
         self._last_result = results
 
         # Check if any hands were detected
         if not results.multi_hand_landmarks:
+            self._count_miss()
             return None
 
+        self._missed_frames = 0
+
         # Extract the first (and only) detected hand
         hand_landmarks = results.multi_hand_landmarks[0]
         handedness = results.multi_handedness[0].classification[0].label
 
-        # Convert landmarks to list of tuples
-        landmarks_list = [
-            (lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark
-        ]
+        # Fill a single (21, 3) array straight from the landmark protos;
+        # fromiter with a known count avoids building per-landmark lists
+        landmark_protos = hand_landmarks.landmark
+        landmarks_array = np.fromiter(
+            (c for lm in landmark_protos for c in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=3 * len(landmark_protos)
+        ).reshape(-1, 3)
+
+        if roi is not None:
+            # Map crop-relative coordinates back onto the full frame; z
+            # shares x's scale in MediaPipe's output
+            roi_x, roi_y, roi_w, roi_h = roi
+            landmarks_array *= (roi_w, roi_h, roi_w)
+            landmarks_array[:, :2] += (roi_x, roi_y)
 
         return HandLandmarks(
-            landmarks=landmarks_list,
+            landmarks=landmarks_array,
             handedness=handedness,
             raw_landmarks=hand_landmarks
         )
@@ -110,7 +342,8 @@ class HandEngine:
             landmark_id: MediaPipe landmark index (0-20).
 
         Returns:
-            Tuple of (x, y, z) normalized coordinates.
+            Array row of (x, y, z) normalized coordinates (indexable
+            like the former tuple).
         """
         return hand_data.landmarks[landmark_id]
 
@@ -121,59 +354,38 @@ class HandEngine:
 
         Args:
             hand_data: HandLandmarks object from process_frame.
-            finger: One of "thumb", "index", "middle", "ring", "pinky".
+            finger: One of "thumb", "index", "middle", "ring", "pinky"
+                (lower-case).
 
         Returns:
-            Tuple of (x, y, z) normalized coordinates.
+            Array row of (x, y, z) normalized coordinates.
         """
-        finger_tips = {
-            "thumb": self.THUMB_TIP,
-            "index": self.INDEX_FINGER_TIP,
-            "middle": self.MIDDLE_FINGER_TIP,
-            "ring": self.RING_FINGER_TIP,
-            "pinky": self.PINKY_TIP
-        }
-        return self.get_landmark(hand_data, finger_tips[finger.lower()])
+        return hand_data.landmarks[self._FINGER_TIPS[finger]]
 
     def is_finger_curled(self, hand_data: HandLandmarks, finger: str) -> bool:
         """
         Check if a finger is curled (for fist detection).
 
-        A finger is considered curled if its tip is below its PIP joint
-        (closer to the palm) in the y-axis.
+        A finger is considered curled if its tip is closer to its MCP joint
+        than 1.2x the PIP joint is (see gesture_kernel.is_curled).
 
         Args:
             hand_data: HandLandmarks object from process_frame.
-            finger: One of "index", "middle", "ring", "pinky".
+            finger: One of "index", "middle", "ring", "pinky" (lower-case).
 
         Returns:
             True if the finger is curled, False otherwise.
         """
-        finger_joints = {
-            "index": (self.INDEX_FINGER_TIP, self.INDEX_FINGER_PIP, self.INDEX_FINGER_MCP),
-            "middle": (self.MIDDLE_FINGER_TIP, self.MIDDLE_FINGER_PIP, self.MIDDLE_FINGER_MCP),
-            "ring": (self.RING_FINGER_TIP, self.RING_FINGER_PIP, self.RING_FINGER_MCP),
-            "pinky": (self.PINKY_TIP, self.PINKY_PIP, self.PINKY_MCP)
-        }
-
-        tip_idx, pip_idx, mcp_idx = finger_joints[finger.lower()]
-        tip = hand_data.landmarks[tip_idx]
-        pip = hand_data.landmarks[pip_idx]
-        mcp = hand_data.landmarks[mcp_idx]
-
-        # Finger is curled if tip is closer to wrist than PIP joint
-        # We check both y-coordinate and distance from MCP
-        tip_to_mcp = np.sqrt((tip[0] - mcp[0])**2 + (tip[1] - mcp[1])**2)
-        pip_to_mcp = np.sqrt((pip[0] - mcp[0])**2 + (pip[1] - mcp[1])**2)
-
-        return tip_to_mcp < pip_to_mcp * 1.2  # Tip should be closer to MCP than PIP
+        tip_idx, pip_idx, mcp_idx = self._FINGER_JOINTS[finger]
+        return bool(gesture_kernel.is_curled(
+            hand_data.landmarks, tip_idx, pip_idx, mcp_idx, CURL_RATIO_SQ))
 
     def is_fist(self, hand_data: HandLandmarks) -> bool:
         """
         Check if the hand is making a fist gesture.
 
         A fist is detected when all four fingers (index, middle, ring, pinky)
-        are curled.
+        are curled (see gesture_kernel.is_fist).
 
         Args:
             hand_data: HandLandmarks object from process_frame.
@@ -181,8 +393,7 @@ class HandEngine:
         Returns:
             True if the hand is making a fist, False otherwise.
         """
-        fingers = ["index", "middle", "ring", "pinky"]
-        return all(self.is_finger_curled(hand_data, f) for f in fingers)
+        return bool(gesture_kernel.is_fist(hand_data.landmarks, CURL_RATIO_SQ))
 
     def close(self):
         """Release MediaPipe resources."""
@@ -195,3 +406,145 @@ class HandEngine:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - release resources."""
         self.close()
+
+
+class AsyncHandEngine:
+    """
+    Runs a HandEngine's MediaPipe inference on a background thread.
+
+    Frames are handed over with submit() and the freshest detection is
+    read back with latest(), so camera capture, gesture handling and
+    rendering overlap with inference. Only the newest frame is kept
+    waiting: if the worker is busy, a pending frame is replaced rather
+    than queued behind it.
+
+    The wrapped HandEngine is only ever used by the worker thread. If
+    inference raises, the worker stops and the exception is re-raised from
+    the next submit() or latest() call.
+    """
+
+    # RGB buffers in the pool: one being inferred, one waiting in the
+    # slot and one being filled by submit()
+    _POOL_SIZE = 3
+
+    def __init__(self):
+        """Initialize MediaPipe and start the inference worker thread."""
+        # Engine owned by the worker thread
+        self._engine = HandEngine()
+        # Part of each frame converted by submit(), on the caller thread
+        self._crop = _InferenceCrop()
+
+        # Pending (RGB crop, roi) pair, or None to stop the worker
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._free_buffers: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(self._POOL_SIZE):
+            self._free_buffers.put(
+                np.empty(self._crop.buffer_shape(), dtype=np.uint8))
+
+        # (sequence number, result) of the newest processed frame, stored
+        # as one tuple so readers never see a mismatched pair
+        self._latest: Tuple[int, Optional[HandLandmarks]] = (0, None)
+        # Exception that stopped the worker, re-raised to the caller
+        self._error: Optional[Exception] = None
+
+        self._worker = threading.Thread(
+            target=self._run, name="HandEngineWorker", daemon=True)
+        self._worker.start()
+
+    def submit(self, bgr_frame: np.ndarray) -> None:
+        """
+        Queue a BGR frame for hand detection.
+
+        The inference crop of the frame is converted to RGB on the calling
+        thread into a pooled buffer, so the caller may draw on bgr_frame
+        as soon as this returns. A previously submitted frame that has
+        not been picked up by the worker yet is dropped.
+
+        Args:
+            bgr_frame: Input frame in BGR format (as read from OpenCV).
+
+        Raises:
+            Exception: Whatever stopped the worker thread, if it failed.
+        """
+        self._raise_worker_error()
+
+        bgr_crop = self._crop.apply(bgr_frame)
+        rgb = self._free_buffers.get()
+        if rgb.shape != bgr_crop.shape:
+            rgb = np.empty(bgr_crop.shape, dtype=np.uint8)
+        cv2.cvtColor(bgr_crop, cv2.COLOR_BGR2RGB, dst=rgb)
+
+        self._replace_pending((rgb, self._crop.roi))
+
+    def latest(self) -> Tuple[int, Optional[HandLandmarks]]:
+        """
+        Get the most recent detection result.
+
+        The worker may not have finished a new frame since the last call,
+        so the result comes with a sequence number; an unchanged number
+        means the same result is being returned again.
+
+        Returns:
+            Tuple of (sequence number, result). The sequence number counts
+            processed frames (0 before the first one); the result is the
+            HandLandmarks from the newest processed frame, or None if no
+            hand was detected in it.
+
+        Raises:
+            Exception: Whatever stopped the worker thread, if it failed.
+        """
+        self._raise_worker_error()
+        return self._latest
+
+    def _raise_worker_error(self) -> None:
+        """Re-raise the exception that stopped the worker, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def _replace_pending(
+            self, item: Optional[Tuple[np.ndarray, Optional[RoiBox]]]) -> None:
+        """Put item in the frame slot, recycling any frame still waiting."""
+        try:
+            stale = self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if stale is not None:
+                self._free_buffers.put(stale[0])
+        # Only this thread fills the slot, so it is guaranteed empty here
+        self._frames.put_nowait(item)
+
+    def _run(self) -> None:
+        """Worker loop: run inference on the newest submitted frame."""
+        seq = 0
+        while True:
+            item = self._frames.get()
+            if item is None:
+                break
+            rgb, roi = item
+            seq += 1
+            try:
+                self._latest = (seq, self._engine.process_frame(rgb, roi))
+            except Exception as e:
+                # Stop here and hand the error to the caller instead of
+                # leaving a stale result behind a dead thread
+                self._latest = (seq, None)
+                self._error = e
+                break
+            finally:
+                self._free_buffers.put(rgb)
+
+    def close(self):
+        """Stop the worker thread and release MediaPipe resources."""
+        if self._worker.is_alive():
+            self._replace_pending(None)
+            self._worker.join()
+        self._engine.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - release resources."""
+        self.close()
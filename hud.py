@@ -5,9 +5,10 @@ Cyberpunk-style visual overlay for the Hand-Gesture Interface.
 Iron Man inspired heads-up display with neon aesthetics.
 """
 
+from collections import OrderedDict
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 import config
 from hand_engine import HandLandmarks
 
@@ -40,9 +41,18 @@ class HUD:
         (0, 17)
     ]
 
+    # HAND_CONNECTIONS as an index array, to gather all segments at once
+    _CONNECTION_INDEX = np.array(HAND_CONNECTIONS, dtype=np.intp)
+
     # Active nodes (fingertips that trigger actions)
     ACTIVE_NODES = [4, 8, 12]  # Thumb, Index, Middle tips
 
+    # All other landmark nodes, drawn as plain green dots
+    REGULAR_NODES = sorted(set(range(21)) - set(ACTIVE_NODES))
+
+    # Maximum number of rendered status texts kept in the cache
+    STATUS_TEXT_CACHE_SIZE = 64
+
     def __init__(self, frame_width: int, frame_height: int):
         """
         Initialize the HUD.
@@ -69,81 +79,188 @@ class HUD:
             int(config.ACTIVE_REGION_Y_END * frame_height)
         )
 
+        # Dash segments of the active region boundary, built once since
+        # the region never changes; drawn with a single polylines call
+        x1, y1, x2, y2 = self.active_region
+        self._active_region_dashes = np.array(
+            self._dash_segments((x1, y1), (x2, y1))    # Top line
+            + self._dash_segments((x1, y2), (x2, y2))  # Bottom line
+            + self._dash_segments((x1, y1), (x1, y2))  # Left line
+            + self._dash_segments((x2, y1), (x2, y2)),  # Right line
+            dtype=np.int32
+        )
+
+        # Origin of the live "EXIT" label, below the status bar
+        self._failsafe_label_org = (
+            self.failsafe_region[0] + 10,
+            config.HUD_STATUS_BAR_HEIGHT + config.FAILSAFE_Y_END - 10)
+
+        # Static chrome (active region + fail-safe box) pre-rendered once
+        # per fail-safe state, as (image, mask) pairs composited per frame
+        self._chrome = {
+            is_triggered: self._render_chrome(is_triggered)
+            for is_triggered in (False, True)
+        }
+
+        # Normalized -> pixel scale applied to all landmarks at once
+        self._pixel_scale = np.array([frame_width, frame_height],
+                                     dtype=np.float32)
+
+        # Status bar height and its bottom edge line, fixed for the session
+        self._bar_height = config.HUD_STATUS_BAR_HEIGHT
+        self._bar_line = ((0, self._bar_height),
+                          (frame_width, self._bar_height))
+
+        # Black backdrop blended into the status bar strip each frame
+        self._bar_overlay = np.zeros(
+            (config.HUD_STATUS_BAR_HEIGHT, frame_width, 3), dtype=np.uint8)
+
+        # Solid text color strip and LRU cache of rendered status text
+        # masks, keyed by the text itself
+        self._bar_text_color = np.full(
+            (config.HUD_STATUS_BAR_HEIGHT, frame_width, 3),
+            config.COLOR_NEON_CYAN, dtype=np.uint8)
+        self._status_text_masks: "OrderedDict[str, np.ndarray]" = \
+            OrderedDict()
+
+        # A binary mask only reproduces putText exactly on OpenCV builds
+        # that do not anti-alias text; on others the text is drawn live
+        probe = np.zeros((self._bar_height, frame_width), dtype=np.uint8)
+        self._put_status_text(probe, "MODE: IDLE | FPS: 0.0", 255)
+        self._cache_status_text = bool(
+            ((probe == 0) | (probe == 255)).all())
+
+    def landmarks_to_pixels(
+            self,
+            hand_data: HandLandmarks) -> List[List[int]]:
+        """
+        Convert all landmarks to pixel coordinates in one vectorized step.
+
+        Args:
+            hand_data: HandLandmarks object with landmark coordinates.
+
+        Returns:
+            List of [x, y] pixel coordinates, indexed by landmark id.
+        """
+        pixels = hand_data.landmarks[:, :2] * self._pixel_scale
+        return pixels.astype(np.int32).tolist()
+
     def draw_skeleton(
             self,
             frame: np.ndarray,
-            hand_data: HandLandmarks) -> None:
+            hand_data: HandLandmarks,
+            points: Optional[List[List[int]]] = None) -> None:
         """
         Draw neon green skeleton lines connecting hand joints.
 
+        Drawn as two layers, all black glow lines and then all green
+        lines, with one polylines call per layer instead of two line
+        calls per connection.
+
         Args:
             frame: Video frame to draw on (modified in place).
             hand_data: HandLandmarks object with landmark coordinates.
+            points: Pixel coordinates from landmarks_to_pixels, if already
+                computed for this frame.
         """
-        landmarks = hand_data.landmarks
-
-        for connection in self.HAND_CONNECTIONS:
-            start_idx, end_idx = connection
-            start = landmarks[start_idx]
-            end = landmarks[end_idx]
-
-            # Convert normalized coordinates to pixel coordinates
-            start_px = (
-                int(start[0] * self.frame_width),
-                int(start[1] * self.frame_height)
-            )
-            end_px = (
-                int(end[0] * self.frame_width),
-                int(end[1] * self.frame_height)
-            )
-
-            # Draw neon glow effect (larger line behind)
-            cv2.line(frame, start_px, end_px,
-                     config.COLOR_BLACK,
-                     config.HUD_LINE_THICKNESS + 2)
-
-            # Draw main neon green line
-            cv2.line(frame, start_px, end_px,
-                     config.COLOR_NEON_GREEN,
-                     config.HUD_LINE_THICKNESS)
+        if points is None:
+            points = self.landmarks_to_pixels(hand_data)
+
+        # (connections, 2, 2) array of segment end points
+        segments = np.array(points, dtype=np.int32)[self._CONNECTION_INDEX]
+
+        # Draw neon glow effect (larger lines behind)
+        cv2.polylines(frame, segments, False, config.COLOR_BLACK,
+                      config.HUD_LINE_THICKNESS + 2)
+
+        # Draw main neon green lines
+        cv2.polylines(frame, segments, False, config.COLOR_NEON_GREEN,
+                      config.HUD_LINE_THICKNESS)
 
     def draw_landmarks(
             self,
             frame: np.ndarray,
-            hand_data: HandLandmarks) -> None:
+            hand_data: HandLandmarks,
+            points: Optional[List[List[int]]] = None) -> None:
         """
         Draw landmark nodes on the hand.
 
         Args:
             frame: Video frame to draw on (modified in place).
             hand_data: HandLandmarks object with landmark coordinates.
+            points: Pixel coordinates from landmarks_to_pixels, if already
+                computed for this frame.
         """
-        landmarks = hand_data.landmarks
-
-        for idx, lm in enumerate(landmarks):
-            # Convert normalized coordinates to pixel coordinates
-            cx = int(lm[0] * self.frame_width)
-            cy = int(lm[1] * self.frame_height)
-
-            if idx in self.ACTIVE_NODES:
-                # Draw active nodes (fingertips) with red color and larger radius
-                # Outer glow
-                cv2.circle(frame, (cx, cy),
-                           config.HUD_ACTIVE_NODE_RADIUS + 4,
-                           config.COLOR_BLACK, -1)
-                # Inner filled circle
-                cv2.circle(frame, (cx, cy),
-                           config.HUD_ACTIVE_NODE_RADIUS,
-                           config.COLOR_NEON_RED, -1)
-                # Center highlight
-                cv2.circle(frame, (cx, cy),
-                           config.HUD_ACTIVE_NODE_RADIUS // 2,
-                           config.COLOR_WHITE, -1)
-            else:
-                # Draw regular nodes with green color
-                cv2.circle(frame, (cx, cy),
-                           config.HUD_NODE_RADIUS,
-                           config.COLOR_NEON_GREEN, -1)
+        if points is None:
+            points = self.landmarks_to_pixels(hand_data)
+
+        # Bind loop invariants to locals for the tight drawing loops
+        circle = cv2.circle
+
+        # Draw regular nodes with green color
+        radius = config.HUD_NODE_RADIUS
+        green = config.COLOR_NEON_GREEN
+        for idx in self.REGULAR_NODES:
+            circle(frame, points[idx], radius, green, -1)
+
+        # Draw active nodes (fingertips) last, on top, with red color and
+        # larger radius
+        active_radius = config.HUD_ACTIVE_NODE_RADIUS
+        black = config.COLOR_BLACK
+        red = config.COLOR_NEON_RED
+        white = config.COLOR_WHITE
+        for idx in self.ACTIVE_NODES:
+            center = points[idx]
+            # Outer glow
+            circle(frame, center, active_radius + 4, black, -1)
+            # Inner filled circle
+            circle(frame, center, active_radius, red, -1)
+            # Center highlight
+            circle(frame, center, active_radius // 2, white, -1)
+
+    def _render_chrome(
+            self,
+            is_triggered: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pre-render the static HUD chrome for compositing.
+
+        Args:
+            is_triggered: Fail-safe state to render.
+
+        Returns:
+            Tuple of (chrome image, uint8 mask of the drawn pixels).
+
+        Note:
+            The "EXIT" label is left out: some OpenCV builds anti-alias
+            text, which a binary mask cannot composite faithfully.
+        """
+        chrome = np.zeros((self.frame_height, self.frame_width, 3),
+                          dtype=np.uint8)
+        self.draw_active_region(chrome)
+        self.draw_failsafe_region(chrome, is_triggered, with_label=False)
+        mask = chrome.any(axis=2).astype(np.uint8)
+        return chrome, mask
+
+    def draw_chrome(
+            self,
+            frame: np.ndarray,
+            is_failsafe: bool = False) -> None:
+        """
+        Composite the pre-rendered active region and fail-safe chrome.
+
+        Equivalent to draw_active_region followed by draw_failsafe_region,
+        but as a single masked copy.
+
+        Args:
+            frame: Video frame to draw on (modified in place).
+            is_failsafe: If True, uses the triggered fail-safe variant.
+        """
+        chrome, mask = self._chrome[bool(is_failsafe)]
+        cv2.copyTo(chrome, mask, frame)
+
+        color = (config.COLOR_NEON_RED if is_failsafe
+                 else config.COLOR_FAILSAFE_RED)
+        self._draw_failsafe_label(frame, color)
 
     def draw_status_bar(
         self,
@@ -161,37 +278,77 @@ class HUD:
             fps: Current FPS value.
             handedness: Hand type ("Left" or "Right").
         """
-        # Draw semi-transparent background
-        overlay = frame.copy()
-        bar_height = config.HUD_STATUS_BAR_HEIGHT
-        cv2.rectangle(overlay, (0, 0), (self.frame_width, bar_height),
-                      config.COLOR_BLACK, -1)
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+        # Draw semi-transparent background (blend only the bar strip, in
+        # place, instead of copying the whole frame)
+        bar = frame[:self._bar_height]
+        cv2.addWeighted(self._bar_overlay, 0.6, bar, 0.4, 0, bar)
 
         # Draw status text
         hand_str = f" | HAND: {handedness}" if handedness else ""
         status_text = f"MODE: {mode} | FPS: {fps:.1f}{hand_str}"
 
-        # Add cyberpunk styling
-        cv2.putText(frame, status_text, (10, 28),
-                    cv2.FONT_HERSHEY_SIMPLEX, config.HUD_FONT_SCALE,
-                    config.COLOR_NEON_CYAN, 2)
+        # Add cyberpunk styling (blit the cached text mask when it is
+        # exact for this OpenCV build)
+        if self._cache_status_text:
+            cv2.copyTo(self._bar_text_color,
+                       self._get_status_text_mask(status_text), bar)
+        else:
+            self._put_status_text(bar, status_text, config.COLOR_NEON_CYAN)
 
         # Draw decorative lines
-        cv2.line(frame, (0, bar_height),
-                 (self.frame_width, bar_height),
-                 config.COLOR_NEON_CYAN, 1)
+        line_start, line_end = self._bar_line
+        cv2.line(frame, line_start, line_end, config.COLOR_NEON_CYAN, 1)
+
+    def _get_status_text_mask(self, status_text: str) -> np.ndarray:
+        """
+        Get the status bar mask for a text, rendering it on a cache miss.
+
+        Mode and handedness are discrete and FPS is shown to one decimal,
+        so the same few texts repeat and nearly every frame is a hit.
+
+        Args:
+            status_text: Text to render.
+
+        Returns:
+            uint8 mask of the text pixels, shaped like the status bar.
+        """
+        masks = self._status_text_masks
+        mask = masks.get(status_text)
+        if mask is not None:
+            masks.move_to_end(status_text)
+            return mask
+
+        # Only used when text renders without anti-aliasing, so the
+        # coverage is already a 0/255 mask
+        mask = np.zeros((self._bar_height, self.frame_width), dtype=np.uint8)
+        self._put_status_text(mask, status_text, 255)
+
+        masks[status_text] = mask
+        if len(masks) > self.STATUS_TEXT_CACHE_SIZE:
+            masks.popitem(last=False)
+        return mask
+
+    @staticmethod
+    def _put_status_text(
+            target: np.ndarray,
+            status_text: str,
+            color: Union[int, Tuple[int, int, int]]) -> None:
+        """Draw the status text into the bar strip (or a mask of it)."""
+        cv2.putText(target, status_text, (10, 28),
+                    cv2.FONT_HERSHEY_SIMPLEX, config.HUD_FONT_SCALE, color, 2)
 
     def draw_failsafe_region(
             self,
             frame: np.ndarray,
-            is_triggered: bool = False) -> None:
+            is_triggered: bool = False,
+            with_label: bool = True) -> None:
         """
         Draw the fail-safe exit region in the top-left corner.
 
         Args:
             frame: Video frame to draw on (modified in place).
             is_triggered: If True, shows warning state.
+            with_label: If False, skips the "EXIT" label.
         """
         x1, y1, x2, y2 = self.failsafe_region
 
@@ -209,7 +366,15 @@ class HUD:
         cv2.line(frame, (x2 - 5, y1 + 5), (x1 + 5, y2 - 5), color, 2)
 
         # Add "EXIT" label
-        cv2.putText(frame, "EXIT", (x1 + 10, y2 - 10),
+        if with_label:
+            self._draw_failsafe_label(frame, color)
+
+    def _draw_failsafe_label(
+            self,
+            frame: np.ndarray,
+            color: Tuple[int, int, int]) -> None:
+        """Draw the "EXIT" label inside the fail-safe region."""
+        cv2.putText(frame, "EXIT", self._failsafe_label_org,
                     cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
 
     def draw_active_region(self, frame: np.ndarray) -> None:
@@ -221,19 +386,9 @@ class HUD:
         """
         x1, y1, x2, y2 = self.active_region
 
-        # Draw dashed rectangle for active region
-        # Top line
-        self._draw_dashed_line(
-            frame, (x1, y1), (x2, y1), config.COLOR_NEON_PURPLE)
-        # Bottom line
-        self._draw_dashed_line(
-            frame, (x1, y2), (x2, y2), config.COLOR_NEON_PURPLE)
-        # Left line
-        self._draw_dashed_line(
-            frame, (x1, y1), (x1, y2), config.COLOR_NEON_PURPLE)
-        # Right line
-        self._draw_dashed_line(
-            frame, (x2, y1), (x2, y2), config.COLOR_NEON_PURPLE)
+        # Draw dashed rectangle for active region (precomputed segments)
+        cv2.polylines(frame, self._active_region_dashes, False,
+                      config.COLOR_NEON_PURPLE, 1)
 
         # Draw corner markers
         corner_size = 20
@@ -258,41 +413,77 @@ class HUD:
         cv2.line(frame, (x2, y2), (x2, y2 - corner_size),
                  config.COLOR_NEON_CYAN, 2)
 
-    def _draw_dashed_line(
-        self,
-        frame: np.ndarray,
+    @staticmethod
+    def _dash_segments(
         start: Tuple[int, int],
         end: Tuple[int, int],
-        color: Tuple[int, int, int],
         dash_length: int = 10
-    ) -> None:
+    ) -> List[List[Tuple[int, int]]]:
         """
-        Draw a dashed line between two points.
+        Compute the dash segments of a dashed line between two points.
 
         Args:
-            frame: Video frame to draw on.
             start: Starting point (x, y).
             end: Ending point (x, y).
-            color: Line color in BGR.
             dash_length: Length of each dash in pixels.
+
+        Returns:
+            List of [p1, p2] point pairs, one per dash.
         """
         dx = end[0] - start[0]
         dy = end[1] - start[1]
+
+        if dx == 0 or dy == 0:
+            # Axis-aligned (like every active region edge): step in whole
+            # pixels along the one moving axis, no sqrt or division
+            step_x = (dx > 0) - (dx < 0)
+            step_y = (dy > 0) - (dy < 0)
+            return [
+                [(start[0] + i * step_x, start[1] + i * step_y),
+                 (start[0] + (i + dash_length) * step_x,
+                  start[1] + (i + dash_length) * step_y)]
+                for i in range(0, abs(dx + dy), dash_length * 2)
+            ]
+
         length = int(np.sqrt(dx * dx + dy * dy))
 
         if length == 0:
-            return
+            return []
 
         # Normalize direction
         dx = dx / length
         dy = dy / length
 
-        # Draw dashes
+        segments = []
         for i in range(0, length, dash_length * 2):
             p1 = (int(start[0] + i * dx), int(start[1] + i * dy))
             p2 = (int(start[0] + (i + dash_length) * dx),
                   int(start[1] + (i + dash_length) * dy))
-            cv2.line(frame, p1, p2, color, 1)
+            segments.append([p1, p2])
+        return segments
+
+    def _draw_dashed_line(
+        self,
+        frame: np.ndarray,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        color: Tuple[int, int, int],
+        dash_length: int = 10
+    ) -> None:
+        """
+        Draw a dashed line between two points.
+
+        Args:
+            frame: Video frame to draw on.
+            start: Starting point (x, y).
+            end: Ending point (x, y).
+            color: Line color in BGR.
+            dash_length: Length of each dash in pixels.
+        """
+        segments = self._dash_segments(start, end, dash_length)
+        if segments:
+            cv2.polylines(frame, np.array(segments, dtype=np.int32), False,
+                          color, 1)
 
     def draw_click_indicator(
         self,
@@ -396,8 +587,11 @@ class HUD:
         """
         Render the complete HUD on the frame.
 
+        Draws directly on the given frame; the caller hands over the
+        frame and must not rely on its original contents afterwards.
+
         Args:
-            frame: Video frame to draw on.
+            frame: Video frame to draw on (modified in place).
             hand_data: HandLandmarks object (or None if no hand detected).
             mode: Current mode string.
             fps: Current FPS value.
@@ -406,21 +600,18 @@ class HUD:
             scroll_delta: Scroll delta for scroll indicator.
 
         Returns:
-            Frame with HUD overlay.
+            The same frame, with HUD overlay.
         """
-        # Make a copy to avoid modifying original
-        display_frame = frame.copy()
-
-        # Draw active region boundary
-        self.draw_active_region(display_frame)
+        display_frame = frame
 
-        # Draw fail-safe region
-        self.draw_failsafe_region(display_frame, is_failsafe)
+        # Draw active region boundary and fail-safe region
+        self.draw_chrome(display_frame, is_failsafe)
 
         # Draw hand visualization if detected
         if hand_data is not None:
-            self.draw_skeleton(display_frame, hand_data)
-            self.draw_landmarks(display_frame, hand_data)
+            points = self.landmarks_to_pixels(hand_data)
+            self.draw_skeleton(display_frame, hand_data, points)
+            self.draw_landmarks(display_frame, hand_data, points)
 
         # Draw mode-specific indicators
         if mode == config.MODE_SCROLL and scroll_delta != 0:
@@ -0,0 +1,21 @@
+"""
+KINETIC-OS JIT Module
+======================
+Optional Numba support.
+Provides njit: Numba's decorator when Numba is installed, otherwise a
+stand-in that leaves the decorated functions as plain Python.
+"""
+
+
+def plain_njit(*args, **kwargs):
+    """Stand-in for numba.njit that returns functions unchanged."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the kernels run as plain Python
+    njit = plain_njit
@@ -19,17 +19,18 @@ Controls:
 import sys
 import time
 import cv2
-
-try:
-    import pyautogui
-except ImportError:
-    print("Error: pyautogui is required. Install with: pip install pyautogui")
-    sys.exit(1)
+import numpy as np
 
 import config
-from hand_engine import HandEngine
-from cursor_math import CursorMath, FPSCounter
+from camera import CameraStream
+from hand_engine import AsyncHandEngine, HandEngine, CURL_RATIO_SQ
+from cursor_math import CursorMath, FPSCounter, CLICK_THRESHOLD_SQ
+from gesture_kernel import classify_hand
 from hud import HUD
+from mouse import create_mouse
+
+# Title of the HUD preview window
+WINDOW_NAME = "KINETIC-OS"
 
 
 class KineticOS:
@@ -41,34 +42,35 @@ class KineticOS:
 
     def __init__(self):
         """Initialize KINETIC-OS components."""
-        # Disable PyAutoGUI fail-safe to prevent conflicts with our own
-        pyautogui.FAILSAFE = False
-        pyautogui.PAUSE = 0  # Remove delay between actions
+        # Mouse output (direct XTest when available, else PyAutoGUI)
+        self.mouse = create_mouse()
 
         # Get screen dimensions
-        self.screen_width, self.screen_height = pyautogui.size()
+        self.screen_width, self.screen_height = self.mouse.size()
         print(f"[KINETIC-OS] Screen: {self.screen_width}x{self.screen_height}")
 
-        # Initialize camera
-        self.cap = cv2.VideoCapture(config.CAMERA_INDEX)
-        if not self.cap.isOpened():
-            raise RuntimeError(f"Failed to open camera at index {config.CAMERA_INDEX}")
-
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.CAMERA_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.CAMERA_HEIGHT)
-        self.cap.set(cv2.CAP_PROP_FPS, config.CAMERA_FPS)
+        # Initialize camera (frames are captured on a background thread)
+        self.camera = CameraStream(
+            config.CAMERA_INDEX, config.CAMERA_WIDTH,
+            config.CAMERA_HEIGHT, config.CAMERA_FPS,
+            use_opencl=config.USE_OPENCL)
 
         # Get actual frame dimensions
-        self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.frame_width = self.camera.frame_width
+        self.frame_height = self.camera.frame_height
         print(f"[KINETIC-OS] Camera: {self.frame_width}x{self.frame_height}")
 
         # Initialize modules
-        self.hand_engine = HandEngine()
+        self.hand_engine = AsyncHandEngine()
         self.cursor_math = CursorMath(self.screen_width, self.screen_height)
         self.hud = HUD(self.frame_width, self.frame_height)
         self.fps_counter = FPSCounter()
 
+        # Warm up the gesture kernel so any JIT compile happens at startup
+        # rather than on the first tracked frame
+        classify_hand(np.zeros((21, 3), dtype=np.float32),
+                      CLICK_THRESHOLD_SQ, CURL_RATIO_SQ)
+
         # State tracking
         self.current_mode = config.MODE_IDLE
         self.last_left_click_time = 0
@@ -80,19 +82,16 @@ class KineticOS:
         self.click_indicator = None
         self.click_indicator_time = 0
 
-        print("[KINETIC-OS] Initialization complete. Starting...")
+        # Last position sent to the mouse (None until the next move)
+        self._last_mouse_xy = None
 
-    def _check_left_click(self, hand_data) -> bool:
-        """Check for left click gesture (thumb to index)."""
-        thumb_tip = self.hand_engine.get_fingertip(hand_data, "thumb")
-        index_tip = self.hand_engine.get_fingertip(hand_data, "index")
-        return self.cursor_math.is_click(thumb_tip, index_tip)
+        # HUD redraw throttle. The next redraw is allowed 10% early so
+        # capture jitter at the same rate does not drop every other frame.
+        self._render_interval = (
+            0.9 / config.HUD_MAX_FPS if config.HUD_MAX_FPS > 0 else 0.0)
+        self._next_render_time = 0.0
 
-    def _check_right_click(self, hand_data) -> bool:
-        """Check for right click gesture (thumb to middle)."""
-        thumb_tip = self.hand_engine.get_fingertip(hand_data, "thumb")
-        middle_tip = self.hand_engine.get_fingertip(hand_data, "middle")
-        return self.cursor_math.is_click(thumb_tip, middle_tip)
+        print("[KINETIC-OS] Initialization complete. Starting...")
 
     def _process_gestures(self, hand_data, current_time: float) -> int:
         """
@@ -107,64 +106,70 @@ class KineticOS:
         """
         scroll_delta = 0
 
-        # Get index finger position for cursor control
-        index_tip = self.hand_engine.get_fingertip(hand_data, "index")
+        # Read the landmark array once; everything below indexes it
+        # directly instead of going through per-landmark helpers
+        landmarks = hand_data.landmarks
 
-        # Apply smoothing
-        smooth_x, smooth_y = self.cursor_math.smooth_position(
-            index_tip[0], index_tip[1])
+        # Get index finger position for cursor control
+        index_x, index_y = landmarks[HandEngine.INDEX_FINGER_TIP, :2].tolist()
 
-        # Map to screen coordinates
-        screen_x, screen_y = self.cursor_math.map_to_screen(smooth_x, smooth_y)
+        # Apply smoothing, map to screen coordinates and check the
+        # fail-safe region in one pass
+        screen_x, screen_y, in_failsafe = self.cursor_math.process_cursor(
+            index_x, index_y)
 
-        # Check for fail-safe region
-        if self.cursor_math.is_in_failsafe_region(screen_x, screen_y):
+        if in_failsafe:
             print("\n[KINETIC-OS] Fail-safe triggered! Exiting...")
             return -999  # Special value to indicate exit
 
+        # Classify fist and click gestures in one compiled pass
+        is_fist, is_left_clicking, is_right_clicking = classify_hand(
+            landmarks, CLICK_THRESHOLD_SQ, CURL_RATIO_SQ)
+
         # Check for fist (scroll mode)
-        if self.hand_engine.is_fist(hand_data):
+        if is_fist:
             self.current_mode = config.MODE_SCROLL
 
-            if not self.is_scrolling:
-                self.is_scrolling = True
-                self.cursor_math.reset_scroll_reference()
-
-            # Calculate scroll delta from Y movement
-            wrist = self.hand_engine.get_landmark(
-                hand_data, self.hand_engine.WRIST)
-            scroll_delta = self.cursor_math.calculate_scroll_delta(wrist[1])
+            # Calculate scroll delta from Y movement (the first fist frame
+            # only sets the reference point)
+            scroll_delta = self.cursor_math.try_scroll(
+                landmarks[HandEngine.WRIST, 1], enabled=self.is_scrolling)
+            self.is_scrolling = True
 
             # Execute scroll with debounce
             debounce_ok = (current_time - self.last_scroll_time) > config.SCROLL_DEBOUNCE_TIME
             if abs(scroll_delta) > 0 and debounce_ok:
                 # Negative because Y is inverted
-                pyautogui.scroll(-scroll_delta)
+                self.mouse.scroll(-scroll_delta)
                 self.last_scroll_time = current_time
         else:
             self.is_scrolling = False
             self.current_mode = config.MODE_ACTIVE
 
-            # Move cursor
-            pyautogui.moveTo(screen_x, screen_y)
+            # Move cursor, unless it would only shift by sub-threshold
+            # jitter from where it was last sent
+            last_xy = self._last_mouse_xy
+            if (last_xy is None
+                    or abs(screen_x - last_xy[0]) + abs(screen_y - last_xy[1])
+                    >= config.CURSOR_MIN_DELTA):
+                self.mouse.move_to(screen_x, screen_y)
+                self._last_mouse_xy = (screen_x, screen_y)
 
             # Check for left click
-            is_left_clicking = self._check_left_click(hand_data)
             if is_left_clicking and not self.is_left_clicking:
                 elapsed = current_time - self.last_left_click_time
                 if elapsed > config.CLICK_DEBOUNCE_TIME:
-                    pyautogui.click(button='left')
+                    self.mouse.click(button='left')
                     self.last_left_click_time = current_time
                     self.click_indicator = ("LEFT", (screen_x, screen_y))
                     self.click_indicator_time = current_time
             self.is_left_clicking = is_left_clicking
 
             # Check for right click
-            is_right_clicking = self._check_right_click(hand_data)
             if is_right_clicking and not self.is_right_clicking:
                 elapsed = current_time - self.last_right_click_time
                 if elapsed > config.CLICK_DEBOUNCE_TIME:
-                    pyautogui.click(button='right')
+                    self.mouse.click(button='right')
                     self.last_right_click_time = current_time
                     self.click_indicator = ("RIGHT", (screen_x, screen_y))
                     self.click_indicator_time = current_time
@@ -176,74 +181,93 @@ class KineticOS:
         """Main application loop."""
         print("[KINETIC-OS] Running... Press 'q' to quit or use fail-safe region.")
 
+        # Sequence number of the last detection result acted on, and the
+        # HUD values derived from it
+        last_result_seq = 0
+        fps = 0.0
+        scroll_delta = 0
+
         try:
             while True:
                 current_time = time.time()
 
-                # Capture frame
-                ret, frame = self.cap.read()
-                if not ret:
+                # Wait for the next mirrored frame from the capture thread,
+                # which grabs frame N+1 while this one is being handled
+                frame = self.camera.read()
+                if frame is None:
                     print("[KINETIC-OS] Failed to capture frame")
                     continue
 
-                # Flip frame for mirror effect
-                frame = cv2.flip(frame, 1)
-
-                # Convert BGR to RGB for MediaPipe
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # Hand the frame to the detection worker and pick up the
+                # freshest result; inference overlaps with the rest of
+                # the loop
+                self.hand_engine.submit(frame)
+                result_seq, hand_data = self.hand_engine.latest()
 
-                # Process frame for hand detection
-                hand_data = self.hand_engine.process_frame(rgb_frame)
-
-                # Calculate FPS
-                fps = self.fps_counter.tick(current_time)
-
-                # Initialize variables
-                scroll_delta = 0
                 is_failsafe = False
 
-                if hand_data is not None:
-                    # Process gestures
-                    result = self._process_gestures(hand_data, current_time)
-
-                    if result == -999:  # Fail-safe exit
-                        is_failsafe = True
-                        # Render one last frame showing fail-safe triggered
-                        display_frame = self.hud.render(
-                            frame, hand_data, "EXIT",
-                            fps, is_failsafe=True
-                        )
-                        cv2.imshow("KINETIC-OS", display_frame)
-                        cv2.waitKey(500)
-                        break
-
-                    scroll_delta = result
-                else:
-                    # No hand detected
-                    self.current_mode = config.MODE_IDLE
-                    self.cursor_math.reset_smoothing()
-                    self.is_left_clicking = False
-                    self.is_right_clicking = False
-                    self.is_scrolling = False
+                # Gestures and FPS only advance on a new detection result:
+                # when inference is slower than the camera the same result
+                # comes back on several frames, and replaying it would step
+                # the cursor smoothing once per frame instead of once per
+                # detection
+                if result_seq != last_result_seq:
+                    last_result_seq = result_seq
+
+                    # Calculate FPS (detection rate)
+                    fps = self.fps_counter.tick(current_time)
+
+                    scroll_delta = 0
+
+                    if hand_data is not None:
+                        # Process gestures
+                        result = self._process_gestures(
+                            hand_data, current_time)
+
+                        if result == -999:  # Fail-safe exit
+                            is_failsafe = True
+                            # Render one last frame showing fail-safe triggered
+                            display_frame = self.hud.render(
+                                frame, hand_data, "EXIT",
+                                fps, is_failsafe=True
+                            )
+                            cv2.imshow(WINDOW_NAME, display_frame)
+                            cv2.waitKey(500)
+                            break
+
+                        scroll_delta = result
+                    else:
+                        # No hand detected
+                        self.current_mode = config.MODE_IDLE
+                        self.cursor_math.reset_smoothing()
+                        self.is_left_clicking = False
+                        self.is_right_clicking = False
+                        self.is_scrolling = False
+                        self._last_mouse_xy = None
 
                 # Clear click indicator after 0.3 seconds
                 if self.click_indicator and (
                         current_time - self.click_indicator_time) > 0.3:
                     self.click_indicator = None
 
-                # Render HUD
-                display_frame = self.hud.render(
-                    frame, hand_data, self.current_mode,
-                    fps, is_failsafe=is_failsafe,
-                    click_info=self.click_indicator,
-                    scroll_delta=scroll_delta
-                )
-
-                # Display frame
-                cv2.imshow("KINETIC-OS", display_frame)
-
-                # Check for quit key
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                # Render and display the HUD at most HUD_MAX_FPS times a
+                # second; gesture handling does not depend on it
+                if current_time >= self._next_render_time:
+                    self._next_render_time = (
+                        current_time + self._render_interval)
+                    display_frame = self.hud.render(
+                        frame, hand_data, self.current_mode,
+                        fps, is_failsafe=is_failsafe,
+                        click_info=self.click_indicator,
+                        scroll_delta=scroll_delta
+                    )
+                    cv2.imshow(WINDOW_NAME, display_frame)
+
+                # Check for quit key. pollKey pumps GUI events without
+                # waitKey's forced sleep, so the frame rate is set by
+                # capture and inference alone.
+                key = cv2.pollKey()
+                if key != -1 and key & 0xFF == ord('q'):
                     print("\n[KINETIC-OS] Quit key pressed. Exiting...")
                     break
 
@@ -256,7 +280,8 @@ class KineticOS:
         """Release resources."""
         print("[KINETIC-OS] Cleaning up...")
         self.hand_engine.close()
-        self.cap.release()
+        self.camera.release()
+        self.mouse.close()
         cv2.destroyAllWindows()
         print("[KINETIC-OS] Goodbye!")
 
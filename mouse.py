@@ -0,0 +1,144 @@
+"""
+KINETIC-OS Mouse Module
+========================
+Mouse output backends.
+Sends pointer events straight to the X server through the XTest
+extension when python-xlib is available, and falls back to PyAutoGUI.
+"""
+
+from typing import Tuple
+
+try:
+    from Xlib import X, display, error as xlib_error
+    from Xlib.ext import xtest
+    XLIB_AVAILABLE = True
+except ImportError:
+    XLIB_AVAILABLE = False
+
+try:
+    import pyautogui
+    PYAUTOGUI_AVAILABLE = True
+except ImportError:
+    PYAUTOGUI_AVAILABLE = False
+
+
+class XTestMouse:
+    """
+    Mouse control through the X11 XTest extension.
+
+    Keeps one display connection open and only flushes after each event
+    (no round-trip), so a move costs a single small request instead of
+    PyAutoGUI's per-call dispatch and sync.
+    """
+
+    # X11 pointer button numbers
+    _BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    _SCROLL_UP = 4
+    _SCROLL_DOWN = 5
+
+    def __init__(self):
+        """
+        Open the X display connection.
+
+        Raises:
+            RuntimeError: If the display cannot be opened or lacks XTest.
+        """
+        try:
+            self._display = display.Display()
+        except xlib_error.DisplayError as e:
+            raise RuntimeError(f"Cannot open X display: {e}") from e
+
+        if not self._display.has_extension("XTEST"):
+            self._display.close()
+            raise RuntimeError(
+                "X server does not support the XTEST extension")
+
+        screen = self._display.screen()
+        self._size = (screen.width_in_pixels, screen.height_in_pixels)
+
+    def size(self) -> Tuple[int, int]:
+        """Get the screen size in pixels."""
+        return self._size
+
+    def move_to(self, x: int, y: int) -> None:
+        """Move the pointer to absolute screen coordinates."""
+        xtest.fake_input(self._display, X.MotionNotify, x=x, y=y)
+        self._display.flush()
+
+    def click(self, button: str = "left") -> None:
+        """Press and release a mouse button ("left", "middle" or "right")."""
+        self._press_release(self._BUTTONS[button])
+        self._display.flush()
+
+    def scroll(self, clicks: int) -> None:
+        """Scroll the wheel; positive clicks scroll up, negative down."""
+        button = self._SCROLL_UP if clicks > 0 else self._SCROLL_DOWN
+        for _ in range(abs(clicks)):
+            self._press_release(button)
+        self._display.flush()
+
+    def _press_release(self, button: int) -> None:
+        """Queue a press and release of an X pointer button."""
+        xtest.fake_input(self._display, X.ButtonPress, button)
+        xtest.fake_input(self._display, X.ButtonRelease, button)
+
+    def close(self) -> None:
+        """Close the display connection."""
+        self._display.close()
+
+
+class PyAutoGUIMouse:
+    """Mouse control through PyAutoGUI (fallback backend)."""
+
+    def __init__(self):
+        """Configure PyAutoGUI for immediate, unguarded actions."""
+        # Disable PyAutoGUI fail-safe to prevent conflicts with our own
+        pyautogui.FAILSAFE = False
+        pyautogui.PAUSE = 0  # Remove delay between actions
+
+    def size(self) -> Tuple[int, int]:
+        """Get the screen size in pixels."""
+        width, height = pyautogui.size()
+        return width, height
+
+    def move_to(self, x: int, y: int) -> None:
+        """Move the pointer to absolute screen coordinates."""
+        pyautogui.moveTo(x, y)
+
+    def click(self, button: str = "left") -> None:
+        """Press and release a mouse button ("left", "middle" or "right")."""
+        pyautogui.click(button=button)
+
+    def scroll(self, clicks: int) -> None:
+        """Scroll the wheel; positive clicks scroll up, negative down."""
+        pyautogui.scroll(clicks)
+
+    def close(self) -> None:
+        """Nothing to release for PyAutoGUI."""
+
+
+def create_mouse():
+    """
+    Create the fastest available mouse backend.
+
+    Returns:
+        XTestMouse if python-xlib can reach an X server with XTest,
+        otherwise PyAutoGUIMouse.
+
+    Raises:
+        RuntimeError: If neither backend is usable.
+    """
+    if XLIB_AVAILABLE:
+        try:
+            return XTestMouse()
+        except RuntimeError as e:
+            if not PYAUTOGUI_AVAILABLE:
+                raise
+            print(f"[KINETIC-OS] XTest unavailable ({e}), using PyAutoGUI")
+
+    if PYAUTOGUI_AVAILABLE:
+        return PyAutoGUIMouse()
+
+    raise RuntimeError(
+        "Mouse control requires python-xlib or pyautogui. "
+        "Install with: pip install pyautogui")